@@ -1,8 +1,7 @@
 #!/bin/bash
-#SBATCH --job-name=thrust-bench-a1o0
+#SBATCH --job-name=thrust-bench
 #SBATCH --partition=gpu
-#SBATCH --gpus=a100:1
-#SBATCH --nodelist=gx02
+#SBATCH --gpus=1
 #SBATCH --output=logs/thrust-bench-%j.out
 #SBATCH --error=logs/thrust-bench-%j.err
 #SBATCH --account=sci-rabl-sustain-data-mgmt
@@ -10,15 +9,26 @@
 #SBATCH --time=08:00:00
 #SBATCH --mail-type=END,FAIL
 
+# Usage (from this directory; command-line options override the #SBATCH defaults):
+#   sbatch --gpus=<type>:1 --job-name=thrust-bench-<label> sort.sh <label> <multiprocessors>
+#   e.g. sbatch --gpus=a100:1 --job-name=thrust-bench-a100 sort.sh a100 108
+# (#SBATCH lines cannot read script arguments, and nvidia-smi does not report the SM count)
+# Results are appended to the consolidated ../../benchmarks/sorting_results_<label>.csv
+GPU_LABEL=${1:-a100}
+MULTIPROCESSORS=${2:-108}
+RESULTS_DIR=../../benchmarks
+
 INTERVAL=0.05
 
 echo "Job started on $(hostname) at $(date)"
 echo "Sampling GPU metrics every ${INTERVAL}s"
 
 #start gpu monitoring
-nvidia-smi --query-gpu=timestamp,utilization.gpu,power.draw,utilization.memory --format=csv,nounits -lms 50 > "logs/gpu_stats-log_a100" & SMI_PID=$!
+nvidia-smi --query-gpu=timestamp,utilization.gpu,power.draw,utilization.memory --format=csv,nounits -lms 50 > "logs/gpu_stats-log_${GPU_LABEL}" & SMI_PID=$!
 
-./sort 1000000000 0
+DEVICE=$(nvidia-smi --query-gpu=name --format=csv,noheader -i 0)
+python3 sort_driver.py --binary ./sort --gpu 0 --output "${RESULTS_DIR}/sorting_results_${GPU_LABEL}.csv" \
+    --device "$DEVICE" --multiprocessors "$MULTIPROCESSORS"
 
 
 kill $SMI_PID
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Adaptive-trial driver for the thrust::sort benchmark binary
+
+Goal:
+- Run `sort <num_elements> <gpu_id>` on one standard key grid for every GPU
+  (2048 + i * 65536 keys, the grid of the 2080 Ti / A40 / A100 / V100 results).
+- Instead of a fixed number of trials, repeat each key count until the 95%
+  confidence interval of Mkeys/s is within --rel-ci of the mean (bounded by
+  --min-trials / --max-trials).
+- Parse the binary's output line by line and append one row per key count to
+  the consolidated sorting_results_*.csv format, so interrupted runs can resume.
+
+Notes:
+- The binary prints one line per run: <keys>,"thrust::sort",<gpu_id>,<seconds>.
+  Any executable printing the same lines (e.g. sort_stub.py) can be used with
+  --binary, so the driver can be exercised without a GPU.
+- Device name and multiprocessor count only label the output rows.
+
+Usage examples:
+  python3 sort_driver.py --binary ./sort --gpu 0 --output ../../benchmarks/sorting_results_a100.csv \\
+      --device "NVIDIA A100-SXM4-80GB" --multiprocessors 108
+"""
+import argparse
+import csv
+import math
+import os
+import statistics
+import subprocess
+
+KEY_GRID_START = 2048
+KEY_GRID_STEP = 65536
+KEY_GRID_POINTS = 1024
+
+HEADER = [
+    "Device", "Multiprocessors", "Type", "Keys", "Trials", "Total Msecs", "Avg. Msecs",
+    "Min Msecs", "Max Msecs", " Avg. Mkeys/s", " Max. Mkeys/s",
+]
+KEY_TYPE = "uint32_t"  # label used by all sorting_results_*.csv
+
+# Two-sided 95% Student-t quantiles by degrees of freedom; 1.96 beyond the table
+T_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262,
+    10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 25: 2.060, 30: 2.042, 40: 2.021, 60: 2.000, 120: 1.980,
+}
+
+
+def standard_key_grid(points: int = KEY_GRID_POINTS) -> list[int]:
+    return [KEY_GRID_START + i * KEY_GRID_STEP for i in range(points)]
+
+
+def t_quantile(dof: int) -> float:
+    # Use the next smaller tabulated dof (conservative)
+    candidates = [d for d in T_95 if d <= dof]
+    return T_95[max(candidates)] if dof <= max(T_95) else 1.96
+
+
+def ci_half_width(samples: list[float]) -> float:
+    if len(samples) < 2:
+        return math.inf
+    return t_quantile(len(samples) - 1) * statistics.stdev(samples) / math.sqrt(len(samples))
+
+
+def parse_line(line: str):
+    """Return (keys, seconds) for a result line, None for other output."""
+    line = line.strip()
+    if line.startswith("Error"):
+        raise RuntimeError(line)
+    fields = next(csv.reader([line])) if line else []
+    if len(fields) != 4 or fields[1] != "thrust::sort":
+        return None
+    return int(fields[0]), float(fields[3])
+
+
+def run_trial(binary: str, keys: int, gpu: int) -> float:
+    """Run the binary once and return the sort time in seconds."""
+    with subprocess.Popen([binary, str(keys), str(gpu)], stdout=subprocess.PIPE, text=True) as proc:
+        seconds = None
+        for line in proc.stdout:
+            result = parse_line(line)
+            if result is not None:
+                if result[0] != keys:
+                    raise RuntimeError(f"Expected {keys} keys, binary reported {result[0]}")
+                seconds = result[1]
+    if proc.returncode != 0 or seconds is None:
+        raise RuntimeError(f"{binary} {keys} {gpu} failed (exit code {proc.returncode})")
+    return seconds
+
+
+def measure(binary: str, keys: int, gpu: int, rel_ci: float, min_trials: int, max_trials: int) -> list[float]:
+    """Run trials until the CI of Mkeys/s is tight enough; return per-trial seconds."""
+    if max_trials < 1 or min_trials > max_trials:
+        raise ValueError(f"Need 1 <= max_trials and min_trials <= max_trials, got {min_trials} / {max_trials}")
+
+    seconds = []
+    rates = []
+    while len(seconds) < max_trials:
+        dt = run_trial(binary, keys, gpu)
+        seconds.append(dt)
+        rates.append(keys / dt / 1e6)
+        if len(seconds) >= min_trials and ci_half_width(rates) <= rel_ci * statistics.fmean(rates):
+            break
+    return seconds
+
+
+def result_row(device: str, multiprocessors: int, keys: int, seconds: list[float]) -> list[str]:
+    msecs = [s * 1e3 for s in seconds]
+    rates = [keys / s / 1e6 for s in seconds]
+    return [
+        device, f" {multiprocessors}", f" {KEY_TYPE}", f" {keys}", f" {len(seconds)}",
+        f" {sum(msecs):.3f}", f" {statistics.fmean(msecs):.3f}", f" {min(msecs):.3f}", f" {max(msecs):.3f}",
+        f" {statistics.fmean(rates):.3f}", f" {max(rates):.3f}",
+    ]
+
+
+def completed_keys(path: str, device: str) -> set[int]:
+    """Key counts already in the results file; refuses files of another device."""
+    if not os.path.exists(path):
+        return set()
+    with open(path, newline="") as f:
+        rows = [row for row in list(csv.reader(f))[1:] if len(row) == len(HEADER)]
+    devices = {row[0].strip() for row in rows} - {device}
+    if devices:
+        raise ValueError(f"{path} contains results of {', '.join(sorted(devices))}, not {device}")
+    return {int(row[3]) for row in rows}
+
+
+def run(binary: str, gpu: int, output: str, device: str, multiprocessors: int, points: int = KEY_GRID_POINTS,
+        rel_ci: float = 0.01, min_trials: int = 5, max_trials: int = 100):
+    """Measure all missing key counts of the grid and append them to output."""
+    if max_trials < 1 or min_trials > max_trials:
+        raise ValueError(f"Need 1 <= max_trials and min_trials <= max_trials, got {min_trials} / {max_trials}")
+
+    done = completed_keys(output, device)
+    new_file = not os.path.exists(output)
+
+    with open(output, "a", newline="") as f:
+        writer = csv.writer(f)
+        if new_file:
+            writer.writerow(HEADER)
+        for keys in standard_key_grid(points):
+            if keys in done:
+                continue
+            seconds = measure(binary, keys, gpu, rel_ci, min_trials, max_trials)
+            row = result_row(device, multiprocessors, keys, seconds)
+            writer.writerow(row)
+            f.flush()
+            print(f"{keys} keys: {len(seconds)} trials, {row[9].strip()} Mkeys/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--binary", default="./sort", help="benchmark executable")
+    parser.add_argument("--gpu", type=int, default=0, help="GPU id passed to the binary")
+    parser.add_argument("--output", required=True, help="consolidated results CSV (appended to)")
+    parser.add_argument("--device", default="unknown", help="device name written to the results")
+    parser.add_argument("--multiprocessors", type=int, default=0, help="SM count written to the results")
+    parser.add_argument("--points", type=int, default=KEY_GRID_POINTS, help="number of key grid points")
+    parser.add_argument("--rel-ci", type=float, default=0.01, help="target 95%% CI half-width relative to the mean")
+    parser.add_argument("--min-trials", type=int, default=5)
+    parser.add_argument("--max-trials", type=int, default=100)
+    args = parser.parse_args()
+
+    try:
+        run(args.binary, args.gpu, args.output, args.device, args.multiprocessors, args.points,
+            args.rel_ci, args.min_trials, args.max_trials)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
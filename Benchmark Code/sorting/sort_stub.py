@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Stand-in for the sort binary: prints the same result line without a GPU.
+
+  ./sort_stub.py <num_elements> <gpu_id>
+
+SORT_STUB_MKEYS sets the simulated throughput (Mkeys/s, default 2000) and
+SORT_STUB_NOISE the relative jitter per run (default 0.02).
+"""
+import os
+import random
+import sys
+
+
+def main():
+    keys, gpu = int(sys.argv[1]), int(sys.argv[2])
+    mkeys = float(os.environ.get("SORT_STUB_MKEYS", 2000))
+    noise = float(os.environ.get("SORT_STUB_NOISE", 0.02))
+
+    seconds = keys / (mkeys * 1e6) * random.uniform(1 - noise, 1 + noise)
+    print("warming up")
+    print(f'{keys},"thrust::sort",{gpu},{seconds:.9f}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import csv
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import sort_driver  # noqa: E402
+
+STUB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sort_stub.py")
+
+
+def read_rows(path):
+    with open(path, newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_stops_at_min_trials_without_noise(monkeypatch):
+    monkeypatch.setenv("SORT_STUB_NOISE", "0")
+    seconds = sort_driver.measure(STUB, 67584, 0, rel_ci=0.01, min_trials=3, max_trials=50)
+    assert len(seconds) == 3
+
+
+def test_stops_at_max_trials_when_ci_stays_wide(monkeypatch):
+    monkeypatch.setenv("SORT_STUB_NOISE", "0.9")
+    seconds = sort_driver.measure(STUB, 67584, 0, rel_ci=1e-6, min_trials=2, max_trials=6)
+    assert len(seconds) == 6
+
+
+def test_rejects_invalid_trial_bounds():
+    with pytest.raises(ValueError):
+        sort_driver.measure(STUB, 2048, 0, rel_ci=0.01, min_trials=0, max_trials=0)
+    with pytest.raises(ValueError):
+        sort_driver.measure(STUB, 2048, 0, rel_ci=0.01, min_trials=5, max_trials=3)
+
+
+def test_writes_consolidated_format_and_resumes(tmp_path, monkeypatch):
+    monkeypatch.setenv("SORT_STUB_NOISE", "0")
+    output = str(tmp_path / "sorting_results_stub.csv")
+
+    sort_driver.run(STUB, 0, output, "Stub GPU", 1, points=2, min_trials=2, max_trials=5)
+    sort_driver.run(STUB, 0, output, "Stub GPU", 1, points=3, min_trials=2, max_trials=5)
+
+    rows = read_rows(output)
+    assert rows[0] == sort_driver.HEADER
+    assert [int(row[3]) for row in rows[1:]] == sort_driver.standard_key_grid(3)
+    assert all(row[2].strip() == "uint32_t" for row in rows[1:])
+    assert float(rows[1][9]) == pytest.approx(2000, rel=1e-3)
+
+
+def test_refuses_to_resume_other_device(tmp_path, monkeypatch):
+    monkeypatch.setenv("SORT_STUB_NOISE", "0")
+    output = str(tmp_path / "sorting_results_stub.csv")
+
+    sort_driver.run(STUB, 0, output, "Stub GPU", 1, points=1, min_trials=2, max_trials=2)
+    with pytest.raises(ValueError):
+        sort_driver.run(STUB, 0, output, "Other GPU", 1, points=2, min_trials=2, max_trials=2)
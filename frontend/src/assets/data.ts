@@ -21,6 +21,7 @@ const CPU_DATA: CPUs = {
     "FP32": 51.22,
     "FP64": 25.61,
     "HBM_STACKS": 5,
+    "DIE_COUNT": 1,
     "MEMORY_TYPE": "HBM2",
     "HPI_AVAILABLE": 1,
     "BENCH_MULT/S_MATRIX": 144665461121157,
@@ -43,6 +44,7 @@ const CPU_DATA: CPUs = {
     "FP32": 14.13,
     "FP64": 7.066,
     "HBM_STACKS": 4,
+    "DIE_COUNT": 1,
     "MEMORY_TYPE": "HBM2",
     "HPI_AVAILABLE": 1,
     "BENCH_MULT/S_MATRIX": 6918619735362,
@@ -65,6 +67,7 @@ const CPU_DATA: CPUs = {
     "FP32": 19.49,
     "FP64": 9.746,
     "HBM_STACKS": 6,
+    "DIE_COUNT": 1,
     "MEMORY_TYPE": "HBM2",
     "HPI_AVAILABLE": 1,
     "BENCH_MULT/S_MATRIX": 9195571412808,
@@ -87,6 +90,7 @@ const CPU_DATA: CPUs = {
     "FP32": 124.16,
     "FP64": 62.08,
     "HBM_STACKS": 4,
+    "DIE_COUNT": 2,
     "MEMORY_TYPE": "HBM3",
     "HPI_AVAILABLE": 1,
     "BENCH_MULT/S_MATRIX": 256410256410256,
@@ -109,6 +113,7 @@ const CPU_DATA: CPUs = {
     "FP32": 37.42,
     "FP64": 0.584,
     "HBM_STACKS": 1,
+    "DIE_COUNT": 1,
     "MEMORY_TYPE": "GDDR6",
     "HPI_AVAILABLE": 1,
     "BENCH_MULT/S_MATRIX": 10652463382157,
@@ -131,6 +136,7 @@ const CPU_DATA: CPUs = {
     "FP32": 13.45,
     "FP64": 0.4202,
     "HBM_STACKS": 1,
+    "DIE_COUNT": 1,
     "MEMORY_TYPE": "GDDR6",
     "HPI_AVAILABLE": 1,
     "BENCH_MULT/S_MATRIX": 5820721769499,
@@ -153,6 +159,7 @@ const CPU_DATA: CPUs = {
     "FP32": 9.526,
     "FP64": 4.763,
     "HBM_STACKS": 4,
+    "DIE_COUNT": 1,
     "MEMORY_TYPE": "HBM2",
     "HPI_AVAILABLE": 0,
     "BENCH_MULT/S_MATRIX": 0,
@@ -175,6 +182,7 @@ const CPU_DATA: CPUs = {
     "FP32": 8.226,
     "FP64": 2.742,
     "HBM_STACKS": 1,
+    "DIE_COUNT": 1,
     "MEMORY_TYPE": "GDDR5",
     "HPI_AVAILABLE": 0,
     "BENCH_MULT/S_MATRIX": 0,
@@ -197,6 +205,7 @@ const CPU_DATA: CPUs = {
     "FP32": 8.141,
     "FP64": 0.2544,
     "HBM_STACKS": 1,
+    "DIE_COUNT": 1,
     "MEMORY_TYPE": "GDDR6",
     "HPI_AVAILABLE": 0,
     "BENCH_MULT/S_MATRIX": 1799532121648,
@@ -219,6 +228,7 @@ const CPU_DATA: CPUs = {
     "FP32": 10.32,
     "FP64": 5.161,
     "HBM_STACKS": 3,
+    "DIE_COUNT": 1,
     "MEMORY_TYPE": "HBM2",
     "HPI_AVAILABLE": 0,
     "BENCH_MULT/S_MATRIX": 0,
@@ -241,6 +251,7 @@ const CPU_DATA: CPUs = {
     "FP32": 90.52,
     "FP64": 1.4143,
     "HBM_STACKS": 1,
+    "DIE_COUNT": 1,
     "MEMORY_TYPE": "GDDR6",
     "HPI_AVAILABLE": 0,
     "BENCH_MULT/S_MATRIX": 22154527831626,
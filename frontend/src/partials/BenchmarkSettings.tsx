@@ -46,6 +46,7 @@ export interface CPUEntry {
   FP32: PerformanceType,
   FP64: PerformanceType,
   HBM_STACKS: number | null,
+  DIE_COUNT: number,
   MEMORY_TYPE: MemoryType,
   HPI_AVAILABLE: number,
   'BENCH_MULT/S_MATRIX': PerformanceType,
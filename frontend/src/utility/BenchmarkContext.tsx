@@ -123,6 +123,7 @@ export const BenchmarkProvider: React.FC<BenchmarkProviderProps> = ({ children }
     CPU_DATA[currentServer.cpu].TDP_IDLE, // dramCapacity in GB
     CPU_DATA[currentServer.cpu].MEMORY_TYPE, // dramCapacity in GB
     CPU_DATA[currentServer.cpu].HBM_STACKS, // dramCapacity in GB
+    CPU_DATA[currentServer.cpu].DIE_COUNT, // dies sharing the die size
   );
 
   // New System
@@ -136,6 +137,7 @@ export const BenchmarkProvider: React.FC<BenchmarkProviderProps> = ({ children }
     CPU_DATA[newServer.cpu].TDP_IDLE,
     CPU_DATA[newServer.cpu].MEMORY_TYPE,
     CPU_DATA[newServer.cpu].HBM_STACKS,
+    CPU_DATA[newServer.cpu].DIE_COUNT,
   );
 
   console.log(currentServer.utilization, newServer.utilization);
@@ -30,6 +30,7 @@ export class System {
   cpuTdpMin: number;
   memoryType: MemoryType;
   hbmStacks: number
+  dieCount: number
 
   constructor(
     packagingSize: number,
@@ -40,7 +41,8 @@ export class System {
     cpuTdpMax: number,
     cpuTdpMin: number | null,
     memoryType: MemoryType,
-    hbmStacks: number | null
+    hbmStacks: number | null,
+    dieCount: number | null = null
   ) {
     /**
      * @param dieSize in cm^2
@@ -50,8 +52,11 @@ export class System {
      * @param ssdCapacity in GB
      * @param hddCapacity in GB
      * @param cpuTdp in Watts
+     * @param dieCount dies sharing packagingSize (e.g. 2 for B200)
      */
-    this.packagingSize = packagingSize;
+    // A B200 has two 800mm2 dies, not a single 1600mm2 die, which would mess with the poisson model
+    this.dieCount = dieCount || 1;
+    this.packagingSize = packagingSize / this.dieCount; // per die
     this.performanceIndicator = performanceIndicator;
     this.lifetime = lifetime;
     this.vramCapacity = vramCapacity;
@@ -74,8 +79,8 @@ export class System {
     const dieAreaCm2 = this.packagingSize;
     const fabYield = Math.exp(-D0 * dieAreaCm2); // Poisson yield model
 
-    // ---- GPU embodied carbon ----
-    const capexGPU = ((CI_FAB * EPA + GPA + MPA) * dieAreaCm2) / fabYield;
+    // ---- GPU embodied carbon (per die, times number of dies) ----
+    const capexGPU = (((CI_FAB * EPA + GPA + MPA) * dieAreaCm2) / fabYield) * this.dieCount;
 
     // ---- HBM yield model ----
     const hbmStackYield = 0.95;
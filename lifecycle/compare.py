@@ -1,8 +1,12 @@
 from .system import System
 from .grid_intensities import GRID_INTENSITY
 from . import constants
+from .workload import WorkloadMix, performance_factors, HARMONIC
 from typing import Union, Tuple
+import math
+import numpy as np
 
+DEFAULT_TIME_HORIZON = 1000
 
 def float_to_days(year_fraction: float) -> int:
     """
@@ -18,7 +22,35 @@ def float_to_days(year_fraction: float) -> int:
     return int(round(year_fraction * 365))
 
 
-def compare_gpus(df, old_gpu: str, new_gpu: str, workload: str, country: str,
+def build_system(row, workload: Union[str, WorkloadMix]) -> System:
+    """
+    Build a System from a single row of the GPU dataset.
+
+    Args:
+        row (Mapping): Row of GPU_DATA.csv (pd.Series or dict)
+        workload (str | WorkloadMix): Column or weighted mix of columns used as performance indicator
+
+    Returns:
+        System: The system described by the row
+    """
+    mix = workload if isinstance(workload, WorkloadMix) else None
+
+    return System(
+        row["DIE_SIZE"] / 100,       # convert mm² → cm²
+        mix.performance_indicator(row) if mix else row[workload],  # performance indicator
+        row["VRAM"],                 # VRAM GB
+        row["PROCESS"],              # process node
+        row["TDP_MAX"],              # max TDP W
+        row["TDP_IDLE"],             # idle TDP W
+        row["MEMORY_TYPE"],          # memory type
+        row["HBM_STACKS"],           # HBM stacks
+        row["GPU"],                  # GPU name
+        mix,
+        row["DIE_COUNT"] if "DIE_COUNT" in row and row["DIE_COUNT"] == row["DIE_COUNT"] else None  # dies (optional column)
+    )
+
+
+def compare_gpus(df, old_gpu: str, new_gpu: str, workload: Union[str, WorkloadMix], country: str,
                  old_util: float = 50, new_util: float = 50, scaling: int = 0):
     """
     Compare two GPUs using the System and generate_systems_comparison logic.
@@ -27,7 +59,7 @@ def compare_gpus(df, old_gpu: str, new_gpu: str, workload: str, country: str,
         df (pd.DataFrame): GPU dataset
         old_gpu (str): Name of old system GPU (e.g., "A100")
         new_gpu (str): Name of new system GPU (e.g., "V100")
-        workload (int/float): Workload parameter
+        workload (str | WorkloadMix): Benchmark column or weighted mix of columns
         country (str): Country code for grid intensity
         lifetime (int): System lifetime in years
         utilization1 (float): Utilization (%) of old_gpu
@@ -38,32 +70,17 @@ def compare_gpus(df, old_gpu: str, new_gpu: str, workload: str, country: str,
         dict: Comparison dictionary
     """
 
-    def build_system(row):
-        return System(
-            row["DIE_SIZE"] / 100,       # convert mm² → cm²
-            row[workload],                 # performance indicator (adjust if needed)
-            row["VRAM"],                 # VRAM GB
-            row["PROCESS"],              # process node
-            row["TDP_MAX"],              # max TDP W
-            row["TDP_IDLE"],             # idle TDP W
-            row["MEMORY_TYPE"],          # memory type
-            row["HBM_STACKS"],           # HBM stacks
-            row["GPU"]                   # GPU name
-        )
-
     # Look up rows
     old_row = df[df["GPU"] == old_gpu].iloc[0]
     new_row = df[df["GPU"] == new_gpu].iloc[0]
 
-    old_system = build_system(old_row)
-    new_system = build_system(new_row)
-
-    TIME_HORIZON = 1000
+    old_system = build_system(old_row, workload)
+    new_system = build_system(new_row, workload)
 
     comparison = generate_systems_comparison(
         old_system,
         new_system,
-        TIME_HORIZON,
+        DEFAULT_TIME_HORIZON,
         country,
         old_util,
         new_util,
@@ -99,6 +116,84 @@ def calculate_intersect(old_system_opex: list[float], new_system_opex: list[floa
     )
     return intersect
 
+def check_workload_mix(old_system: System, new_system: System):
+    """Raise ValueError unless both systems use the same workload mix (or none)."""
+    if new_system.workload_mix != old_system.workload_mix:
+        raise ValueError(
+            f"Both systems must use the same workload mix, got {old_system.workload_mix} and {new_system.workload_mix}"
+        )
+
+
+def calculate_performance_factor(old_system: System, new_system: System) -> float:
+    """
+    Performance factor old / new. For systems built from a WorkloadMix the
+    factor is computed per component and combined by the mix's mean, which
+    raises ValueError for zero or missing components (a plain column gives
+    inf or 0 instead).
+    """
+    check_workload_mix(old_system, new_system)
+    mix = new_system.workload_mix
+    if mix is None:
+        return old_system.performance_indicator / new_system.performance_indicator
+    return mix.performance_factor(old_system.performance_indicator, new_system.performance_indicator)
+
+
+def generate_mix_breakevens(
+    old_system: System,
+    new_system: System,
+    country: str,
+    old_system_utilization: float,
+    new_system_utilization: float,
+    scaling: int,
+    weights,
+    columns: list[str],
+    mean: str = HARMONIC,
+):
+    """
+    Breakeven time of replacing old_system by new_system for many workload
+    mixes at once.
+
+    Both systems must carry per-component performance indicators
+    ({column: value}, e.g. built with build_system(row, WorkloadMix(...))).
+    With SCALING_EMISSIONS the old system OPEX is divided by the mix's
+    performance factor; with SCALING_UTILIZATION the new system runs at
+    min(100, old utilization * performance factor). Without scaling the mix
+    does not affect the result and the performance values are not read.
+
+    Args:
+        weights: normalized weight matrix of shape (m, len(columns)), see workload.mix_weights
+        columns: benchmark columns of the weight matrix
+
+    Returns:
+        np.ndarray: Breakeven time step per mix (np.inf if never reached), shape (m,)
+    """
+    if scaling in (constants.SCALING_EMISSIONS, constants.SCALING_UTILIZATION):
+        old_values = [old_system.performance_indicator[c] for c in columns]
+        new_values = [new_system.performance_indicator[c] for c in columns]
+        factors = performance_factors(old_values, new_values, weights, mean)
+    else:
+        factors = np.ones(len(weights))
+
+    capex = new_system.calculate_capex_emissions()["TOTAL"]
+    old_slope = np.full_like(factors, old_system.calculate_opex_emissions(old_system_utilization, country)["opexPerYear"])
+
+    if scaling == constants.SCALING_UTILIZATION:
+        # Power is linear in utilization, so the OPEX slope is too
+        utilization = np.minimum(100, old_system_utilization * factors)
+        idle = new_system.calculate_opex_emissions(0, country)["opexPerYear"]
+        full = new_system.calculate_opex_emissions(100, country)["opexPerYear"]
+        new_slope = idle + (full - idle) * utilization / 100
+    else:
+        new_slope = np.full_like(factors, new_system.calculate_opex_emissions(new_system_utilization, country)["opexPerYear"])
+
+    if scaling == constants.SCALING_EMISSIONS:
+        old_slope = old_slope / factors
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        breakeven = capex / (old_slope - new_slope)
+    return np.where(old_slope > new_slope, breakeven, np.inf)
+
+
 def generate_systems_comparison(
     old_system: System,
     new_system: System,
@@ -107,17 +202,22 @@ def generate_systems_comparison(
     old_system_utilization: float,
     new_system_utilization: float,
     scaling: int,
+    tables: dict = None,
 ):
+    """
+    :param tables: lookup tables overriding the module ones (optional, see constants.copy_tables)
+    """
     # --- New system OPEX and CAPEX ---
     new_system_emissions = new_system.generate_accum_projected_opex_emissions(
         time_horizon,
         constants.NEW_SYSTEM,
         country,
         new_system_utilization,
+        tables,
     )
     new_system_opex = new_system_emissions["projected"]
 
-    new_system_capex_breakdown = new_system.calculate_capex_emissions()
+    new_system_capex_breakdown = new_system.calculate_capex_emissions(tables)
     new_system_capex = new_system_capex_breakdown["TOTAL"]
 
     # --- Old system OPEX ---
@@ -126,13 +226,15 @@ def generate_systems_comparison(
         constants.OLD_SYSTEM,
         country,
         old_system_utilization,
+        tables,
     )
     old_system_opex = old_system_emissions["projected"]
 
-    # --- Performance factor ---
-    performance_factor = old_system.performance_indicator / new_system.performance_indicator
+    # --- Performance factor (only read by emissions scaling) ---
+    check_workload_mix(old_system, new_system)
 
     if scaling == constants.SCALING_EMISSIONS:
+        performance_factor = calculate_performance_factor(old_system, new_system)
         # Adjust old system OPEX based on performance factor
         old_system_opex = [opex / performance_factor for opex in old_system_opex]
 
@@ -145,8 +247,8 @@ def generate_systems_comparison(
     # Relative savings
     relative_savings = [1 - (old_opex / new_opex) for new_opex, old_opex in zip(new_system_opex, old_system_opex)]
 
-    # OPEX ratio
-    ratio = [new_opex / old_opex for new_opex, old_opex in zip(new_system_opex, old_system_opex)]
+    # OPEX ratio (old OPEX is 0 at t=0; numpy row values would give inf there too)
+    ratio = [new_opex / old_opex if old_opex else math.inf for new_opex, old_opex in zip(new_system_opex, old_system_opex)]
 
     return {
         "newSystemOpex": new_system_opex,
@@ -34,37 +34,64 @@ def get_scaling_string(scaling):
     }
     return scaling_map.get(scaling, "Unknown Scaling")
 
-def get_energy_per_area(process_node):
-    energy_map = {
-        4: 2.75,
-        5: 2.75,
-        7: 1.52,
-        8: 1.52,
-        12: 1.3,
-        16: 1.2,
-        28: 0.9,
-    }
-    return energy_map.get(process_node, None)
-
-
-def get_gas_per_area(process_node):
-    gas_map = {
-        4: 0.327,
-        5: 0.327,
-        7: 0.275,
-        8: 0.275,
-        12: 0.177,
-        16: 0.160,
-        28: 0.1375,
-    }
-    return gas_map.get(process_node, None)
+# Fab / yield constants
+MPA = 0.5               # Procure materials | kg CO2 per cm^2
+CI_FAB = 0.486          # kg CO2 per kWh (Taiwan grid mix)
+DEFECT_DENSITY = 0.1    # defects per cm^2 (D0)
+HBM_STACK_YIELD = 0.95  # yield per HBM stack
+
+# Fab energy per area (EPA) | kWh per cm^2, keyed by process node (nm)
+ENERGY_PER_AREA = {
+    4: 2.75,
+    5: 2.75,
+    7: 1.52,
+    8: 1.52,
+    12: 1.3,
+    16: 1.2,
+    28: 0.9,
+}
+
+# Gas per area (GPA) | kg CO2 per cm^2, keyed by process node (nm)
+GAS_PER_AREA = {
+    4: 0.327,
+    5: 0.327,
+    7: 0.275,
+    8: 0.275,
+    12: 0.177,
+    16: 0.160,
+    28: 0.1375,
+}
+
+# Embodied carbon of memory | kg CO2 per GB, keyed by memory type
+VRAM_EMBODIED = {
+    "GDDR5": 0.29,
+    "GDDR6": 0.36,
+    "HBM2": 0.28,
+    "HBM3": 0.24,
+}
+
+def get_energy_per_area(process_node, table=None):
+    return (ENERGY_PER_AREA if table is None else table).get(process_node, None)
+
+
+def get_gas_per_area(process_node, table=None):
+    return (GAS_PER_AREA if table is None else table).get(process_node, None)
+
+
+def get_vram_embodied(component, table=None):
+    return (VRAM_EMBODIED if table is None else table).get(component, None)
+
 
+def copy_tables():
+    """
+    Snapshot of the lookup tables, keyed like the `tables` argument of the
+    System / comparison functions (missing keys fall back to the module tables).
+    """
+    from .grid_intensities import GRID_INTENSITY
 
-def get_vram_embodied(component):
-    embodied_map = {
-        "GDDR5": 0.29,
-        "GDDR6": 0.36,
-        "HBM2": 0.28,
-        "HBM3": 0.24,
+    return {
+        "grid_intensity": dict(GRID_INTENSITY),
+        "energy_per_area": dict(ENERGY_PER_AREA),
+        "gas_per_area": dict(GAS_PER_AREA),
+        "vram_embodied": dict(VRAM_EMBODIED),
     }
-    return embodied_map.get(component, None)
@@ -0,0 +1,244 @@
+from .store import ComparisonKey
+from typing import Iterable, Iterator, Tuple, Optional
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Per-time-step series of generate_systems_comparison -> column name
+SERIES_COLUMNS = {
+    "newSystemOpex": "new_system_opex",
+    "oldSystemOpex": "old_system_opex",
+    "absSavings": "abs_savings",
+    "relativeSavings": "relative_savings",
+    "ratio": "ratio",
+}
+
+# Input labels, dictionary-encoded since they repeat on every time step
+DICTIONARY_COLUMNS = ("old_gpu", "new_gpu", "workload", "country")
+LABEL_TYPE = pa.dictionary(pa.int32(), pa.string())
+
+COMPARISON_SCHEMA = pa.schema([
+    # Pair / inputs
+    ("old_gpu", LABEL_TYPE),
+    ("new_gpu", LABEL_TYPE),
+    ("workload", LABEL_TYPE),
+    ("country", LABEL_TYPE),
+    ("old_util", pa.float64()),
+    ("new_util", pa.float64()),
+    ("scaling", pa.int8()),
+    ("time", pa.int32()),
+    # Metrics
+    ("new_system_opex", pa.float64()),
+    ("old_system_opex", pa.float64()),
+    ("abs_savings", pa.float64()),
+    ("relative_savings", pa.float64()),
+    ("ratio", pa.float64()),
+    ("capex_total", pa.float64()),
+    ("old_power", pa.float64()),
+    ("new_power", pa.float64()),
+])
+
+PARQUET = "parquet"
+ARROW = "arrow"
+
+
+def comparisons_to_record_batch(items: Iterable[Tuple[ComparisonKey, dict]],
+                                dictionaries: Optional[dict] = None) -> pa.RecordBatch:
+    """
+    Convert comparisons into a single record batch in long format,
+    one row per (comparison, time step).
+
+    Args:
+        items: (ComparisonKey, comparison) pairs, e.g. ComparisonStore.items()
+        dictionaries: column -> {label: index}, extended in place; pass the same
+            dicts for consecutive batches so their dictionaries only grow
+
+    Returns:
+        pa.RecordBatch: Batch with COMPARISON_SCHEMA
+    """
+    keys = []
+    lengths = []
+    series = {column: [] for column in SERIES_COLUMNS.values()}
+    scalars = {"capex_total": [], "old_power": [], "new_power": []}
+
+    for key, comparison in items:
+        keys.append(key)
+        lengths.append(len(comparison["newSystemOpex"]))
+        for name, column in SERIES_COLUMNS.items():
+            series[column].append(np.asarray(comparison[name], dtype=np.float64))
+        scalars["capex_total"].append(comparison["capexBreakdown"]["TOTAL"])
+        scalars["old_power"].append(comparison["oldPowerConsumption"])
+        scalars["new_power"].append(comparison["newPowerConsumption"])
+
+    lengths = np.asarray(lengths, dtype=np.int64)
+
+    def repeat(values, dtype=None):
+        return np.repeat(np.asarray(values, dtype=dtype), lengths)
+
+    if dictionaries is None:
+        dictionaries = {}
+    labels = {}
+    for field in DICTIONARY_COLUMNS:
+        dictionary = dictionaries.setdefault(field, {})
+        indices = [dictionary.setdefault(str(getattr(key, field)), len(dictionary)) for key in keys]
+        labels[field] = pa.DictionaryArray.from_arrays(
+            pa.array(repeat(indices, np.int32), type=pa.int32()),
+            pa.array(list(dictionary), type=pa.string()),
+        )
+
+    columns = {}
+    columns["old_util"] = repeat([key.old_util for key in keys], np.float64)
+    columns["new_util"] = repeat([key.new_util for key in keys], np.float64)
+    columns["scaling"] = repeat([key.scaling for key in keys], np.int8)
+    columns["time"] = (
+        np.concatenate([np.arange(n, dtype=np.int32) for n in lengths]) if keys else np.empty(0, np.int32)
+    )
+    for column, values in series.items():
+        columns[column] = np.concatenate(values) if values else np.empty(0, np.float64)
+    for column, values in scalars.items():
+        columns[column] = repeat(values, np.float64)
+
+    return pa.RecordBatch.from_arrays(
+        [
+            labels[field.name] if field.name in labels else pa.array(columns[field.name], type=field.type)
+            for field in COMPARISON_SCHEMA
+        ],
+        schema=COMPARISON_SCHEMA,
+    )
+
+
+def _format_from_path(path: str) -> str:
+    return PARQUET if str(path).endswith(".parquet") else ARROW
+
+
+class ResultWriter:
+    """
+    Streaming writer for comparison results.
+
+    Comparisons are buffered and flushed as one record batch (Parquet row
+    group / Arrow IPC batch) every `batch_size` comparisons, so sweeps larger
+    than memory can be written incrementally:
+
+        with ResultWriter("sweep.parquet") as writer:
+            for key, comparison in store.items():
+                writer.write(key, comparison)
+    """
+
+    def __init__(self, path: str, format: Optional[str] = None, batch_size: int = 256,
+                 compression: str = "zstd"):
+        """
+        :param path: output file
+        :param format: PARQUET or ARROW (IPC file); inferred from the suffix if omitted
+        :param batch_size: comparisons per record batch
+        :param compression: Parquet compression codec
+        """
+        self.path = path
+        self.format = format or _format_from_path(path)
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self._buffer = []
+        self._dictionaries = {}
+
+        if self.format == PARQUET:
+            self._writer = pq.ParquetWriter(path, COMPARISON_SCHEMA, compression=compression)
+        elif self.format == ARROW:
+            self._sink = pa.OSFile(str(path), "wb")
+            # Label dictionaries only grow, which the IPC file format allows as deltas
+            options = pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+            self._writer = pa.ipc.new_file(self._sink, COMPARISON_SCHEMA, options=options)
+        else:
+            raise ValueError(f"Unknown format: {self.format}")
+
+    def write(self, key: ComparisonKey, comparison: dict):
+        self._buffer.append((key, comparison))
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def write_all(self, items: Iterable[Tuple[ComparisonKey, dict]]):
+        for key, comparison in items:
+            self.write(key, comparison)
+
+    def flush(self):
+        if not self._buffer:
+            return
+        batch = comparisons_to_record_batch(self._buffer, self._dictionaries)
+        self._buffer = []
+        self._writer.write_batch(batch)
+        self.rows_written += batch.num_rows
+
+    def close(self, flush: bool = True):
+        try:
+            if flush:
+                self.flush()
+        finally:
+            self._writer.close()
+            if self.format == ARROW:
+                self._sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Don't flush a possibly broken buffer on top of the original error
+        self.close(flush=exc_type is None)
+
+
+def write_results(path: str, items: Iterable[Tuple[ComparisonKey, dict]], **kwargs) -> int:
+    """
+    Write (ComparisonKey, comparison) pairs to Parquet or Arrow IPC.
+
+    Returns:
+        int: Number of rows written
+    """
+    with ResultWriter(path, **kwargs) as writer:
+        writer.write_all(items)
+    return writer.rows_written
+
+
+def read_results(path: str, columns: Optional[list] = None) -> pa.Table:
+    """
+    Read results written by ResultWriter. Arrow IPC files are memory-mapped,
+    so the returned table references the file without copying.
+    """
+    if _format_from_path(path) == PARQUET:
+        return pq.read_table(path, columns=columns)
+    # The table keeps the mapping alive, so the source is not closed here
+    table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+    return table.select(columns) if columns is not None else table
+
+
+def _chunk_to_numpy(array) -> np.ndarray:
+    return array.to_numpy(zero_copy_only=array.null_count == 0 and pa.types.is_primitive(array.type))
+
+
+def iter_numpy(table: pa.Table, column: str) -> Iterator[np.ndarray]:
+    """
+    Yield a numeric column one record batch (chunk) at a time. Each array is
+    a zero-copy view on the Arrow buffers (for memory-mapped Arrow files, on
+    the file itself), so large sweeps can be reduced without materializing
+    the whole column:
+
+        total = sum(chunk.sum() for chunk in iter_numpy(table, "abs_savings"))
+    """
+    for array in table.column(column).chunks:
+        yield _chunk_to_numpy(array)
+
+
+def to_numpy(table: pa.Table, column: str) -> np.ndarray:
+    """
+    Return a numeric column as a single NumPy array. This is only zero-copy
+    for single-chunk columns; files written by ResultWriter have one chunk per
+    batch, so their columns are copied into one array. Use iter_numpy to
+    process them without copying.
+    """
+    array = table.column(column)
+    array = array.chunk(0) if array.num_chunks == 1 else array.combine_chunks()
+    return _chunk_to_numpy(array)
+
+
+def to_pandas(table: pa.Table):
+    """
+    Convert to a pandas DataFrame, keeping numeric columns as views on the
+    Arrow buffers where possible.
+    """
+    return table.to_pandas(split_blocks=True, zero_copy_only=False)
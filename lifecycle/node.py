@@ -0,0 +1,250 @@
+from .system import System, PowerModel
+from .grid_intensities import GRID_INTENSITY
+from . import constants
+from typing import Union, Sequence, Mapping
+import numpy as np
+import pandas as pd
+
+# Component kinds
+DIE = "die"        # logic die: area, process node, dies per package
+MEMORY = "memory"  # DRAM / HBM: capacity, memory type, stacks
+FIXED = "fixed"    # board, chassis, PSU, ...: embodied kg per unit given directly
+
+# Component roles
+ROLE_GPU = "gpu"   # GPU dies and VRAM; dies count as "GPU" in the CAPEX breakdown
+
+# Yield models (yield_param in parentheses)
+POISSON = "poisson"  # exp(-D0 * A) (defect density D0)
+MURPHY = "murphy"    # ((1 - exp(-D0 * A)) / (D0 * A))^2 (defect density D0)
+STACK = "stack"      # yield_per_stack ** stacks (yield per stack)
+FIXED_YIELD = "fixed"  # constant yield (yield)
+NO_YIELD = "none"    # yield 1
+
+# Bill-of-materials columns and defaults
+BOM_DEFAULTS = {
+    "component": "",
+    "kind": FIXED,
+    "role": "",
+    "count": 1,
+    "area": 0.0,          # cm^2 per die
+    "process": 0,         # nm
+    "dies": 1,
+    "memory_type": "",
+    "capacity": 0.0,      # GB
+    "stacks": 0,
+    "embodied": 0.0,      # kg CO2 per unit (FIXED)
+    "yield_model": NO_YIELD,
+    "yield_param": np.nan,
+    "power_max": 0.0,     # W per unit
+    "power_min": 0.0,     # W per unit
+    "performance": 0.0,   # performance indicator per unit
+}
+
+DEFAULT_YIELD_PARAM = {
+    POISSON: constants.DEFECT_DENSITY,
+    MURPHY: constants.DEFECT_DENSITY,
+    STACK: constants.HBM_STACK_YIELD,
+    FIXED_YIELD: 1.0,
+    NO_YIELD: 1.0,
+}
+
+
+def bill_of_materials(rows: Union[pd.DataFrame, Sequence[Mapping]]) -> pd.DataFrame:
+    """Bill-of-materials table with all BOM_DEFAULTS columns filled in."""
+    bom = pd.DataFrame(rows).reset_index(drop=True)
+    for column, default in BOM_DEFAULTS.items():
+        if column not in bom:
+            bom[column] = default
+        elif not pd.isna(default):
+            bom[column] = bom[column].fillna(default)
+    bom["yield_param"] = bom["yield_param"].fillna(bom["yield_model"].map(DEFAULT_YIELD_PARAM))
+    return bom
+
+
+def gpu_components(system: System, count: int = 1) -> list[dict]:
+    """
+    BOM rows for a GPU: its die(s) (Poisson yield, carrying power and
+    performance) and its VRAM (per-stack yield). Matches
+    System.calculate_capex_emissions per unit.
+    """
+    if not isinstance(system, System):
+        raise TypeError(f"gpu_components needs a System, got {type(system).__name__}")
+
+    return [
+        {
+            "component": f"{system.name} die",
+            "kind": DIE,
+            "role": ROLE_GPU,
+            "count": count,
+            "area": system.packaging_size,
+            "process": system.process_node,
+            "dies": system.die_count,
+            "yield_model": POISSON,
+            "power_max": system.gpu_tdp_max,
+            "power_min": system.gpu_tdp_min,
+            "performance": system.performance_indicator,
+        },
+        {
+            "component": f"{system.name} VRAM",
+            "kind": MEMORY,
+            "role": ROLE_GPU,
+            "count": count,
+            "memory_type": system.memory_type,
+            "capacity": system.vram_capacity,
+            "stacks": system.hbm_stacks,
+            "yield_model": STACK,
+        },
+    ]
+
+
+def component_yields(bom: pd.DataFrame) -> np.ndarray:
+    """Yield per component row according to its yield model."""
+    model = bom["yield_model"].to_numpy()
+    param = bom["yield_param"].to_numpy(dtype=np.float64)
+    defects = param * bom["area"].to_numpy(dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        murphy = np.where(defects > 0, ((1 - np.exp(-defects)) / defects) ** 2, 1.0)
+
+    return np.select(
+        [model == POISSON, model == MURPHY, model == STACK, model == FIXED_YIELD],
+        [np.exp(-defects), murphy, param ** bom["stacks"].to_numpy(dtype=np.float64), param],
+        default=1.0,
+    )
+
+
+def component_embodied(bom: pd.DataFrame, tables=None) -> np.ndarray:
+    """
+    Embodied carbon per unit of each component row (kg CO2).
+
+    :param tables: lookup tables overriding the module ones (optional, see constants.copy_tables)
+    """
+    tables = tables or {}
+    kind = bom["kind"].to_numpy()
+    yields = component_yields(bom)
+
+    energy_per_area = tables.get("energy_per_area", constants.ENERGY_PER_AREA)
+    gas_per_area = tables.get("gas_per_area", constants.GAS_PER_AREA)
+    vram_embodied = tables.get("vram_embodied", constants.VRAM_EMBODIED)
+
+    epa = bom["process"].map(energy_per_area).fillna(0).to_numpy(dtype=np.float64)
+    gpa = bom["process"].map(gas_per_area).fillna(0).to_numpy(dtype=np.float64)
+    die = (
+        ((constants.CI_FAB * epa) + gpa + constants.MPA) * bom["area"].to_numpy(dtype=np.float64)
+        * bom["dies"].to_numpy(dtype=np.float64)
+    )
+
+    vram = bom["memory_type"].map(vram_embodied).fillna(0).to_numpy(dtype=np.float64)
+    memory = bom["capacity"].to_numpy(dtype=np.float64) * vram
+
+    embodied = np.select([kind == DIE, kind == MEMORY], [die, memory], default=0.0) / yields
+    return embodied + bom["embodied"].to_numpy(dtype=np.float64)
+
+
+def aggregate_performance(bom: pd.DataFrame, counts, workload_mix=None):
+    """
+    Sum performance over components: counts @ performance. Components with
+    {column: value} performance (workload mixes) need the workload_mix and
+    give {column: sum} instead.
+    """
+    counts = np.asarray(counts, dtype=np.float64)
+    values = bom["performance"].tolist()
+
+    if workload_mix is None:
+        if any(isinstance(v, Mapping) for v in values):
+            raise ValueError("BOM performance holds {column: value} entries, pass workload_mix to aggregate them")
+        return counts @ np.asarray(values, dtype=np.float64)
+
+    return {
+        column: counts @ np.array([v.get(column, 0.0) if isinstance(v, Mapping) else 0.0 for v in values])
+        for column in workload_mix.columns
+    }
+
+
+class Node(PowerModel):
+    """
+    Multi-GPU node (e.g. 8-GPU HGX or 4-GPU PCIe server) described by a
+    bill of materials. Aggregates embodied carbon, power and performance over
+    all components and provides the interface generate_systems_comparison,
+    WhatIfSession and FleetGPU use: calculate_capex_emissions, the
+    PowerModel OPEX methods, performance_indicator, workload_mix and name.
+
+    All components share the node utilization, so the node power model is
+    the linear one with gpu_tdp_max / gpu_tdp_min summed over the BOM.
+    """
+
+    def __init__(self, bom: Union[pd.DataFrame, Sequence[Mapping]], name: str = "", workload_mix=None):
+        """
+        :param bom: bill-of-materials rows, see BOM_DEFAULTS
+        :param name: node name
+        :param workload_mix: WorkloadMix, if component performance values are {column: value}
+        """
+        self.bom = bill_of_materials(bom)
+        self.name = name
+        self.workload_mix = workload_mix
+
+        counts = self.bom["count"].to_numpy(dtype=np.float64)
+        self.component_embodied = component_embodied(self.bom)
+        self.gpu_tdp_max = float(counts @ self.bom["power_max"].to_numpy(dtype=np.float64))
+        self.gpu_tdp_min = float(counts @ self.bom["power_min"].to_numpy(dtype=np.float64))
+
+        performance = aggregate_performance(self.bom, counts, workload_mix)
+        if workload_mix is None:
+            self.performance_indicator = float(performance)
+        else:
+            self.performance_indicator = {column: float(value) for column, value in performance.items()}
+
+    def embodied_breakdown(self) -> dict:
+        """Embodied carbon per component (kg CO2), summed over its count."""
+        totals = self.bom["count"].to_numpy(dtype=np.float64) * self.component_embodied
+        return pd.Series(totals, index=self.bom["component"]).groupby(level=0, sort=False).sum().to_dict()
+
+    def calculate_capex_emissions(self, tables=None):
+        """
+        :param tables: lookup tables overriding the module ones (optional, see constants.copy_tables)
+        """
+        embodied = self.component_embodied if not tables else component_embodied(self.bom, tables)
+        counts = self.bom["count"].to_numpy(dtype=np.float64)
+        # "GPU" covers the GPU dies only, as in System.calculate_capex_emissions
+        gpu = (self.bom["role"].to_numpy() == ROLE_GPU) & (self.bom["kind"].to_numpy() == DIE)
+        return {
+            "GPU": float(counts[gpu] @ embodied[gpu]),
+            "TOTAL": float(counts @ embodied),
+        }
+
+
+def sweep_configurations(bom: Union[pd.DataFrame, Sequence[Mapping]], counts, utilization=constants.UTILIZATION_DEFAULT,
+                         country: str = None, workload_mix=None):
+    """
+    Evaluate many node / rack configurations built from the same components.
+
+    Args:
+        bom: bill-of-materials rows (count column is ignored)
+        counts: component counts per configuration, shape (configs, components)
+        utilization: utilization in %, scalar or shape (configs,)
+        country: grid intensity for OPEX (optional)
+        workload_mix: WorkloadMix, required if component performance values are {column: value}
+
+    Returns:
+        dict: Arrays of shape (configs,) with embodied carbon (kg), min/max power (W),
+        power at the given utilization (kW), performance ({column: array} with a
+        workload_mix) and, if country is given, OPEX per year (kg CO2)
+    """
+    bom = bill_of_materials(bom)
+    counts = np.asarray(counts, dtype=np.float64)
+
+    power_max = counts @ bom["power_max"].to_numpy(dtype=np.float64)
+    power_min = counts @ bom["power_min"].to_numpy(dtype=np.float64)
+    power = (power_min + np.asarray(utilization) * (power_max - power_min) / 100) / 1000  # kW
+
+    result = {
+        "embodied": counts @ component_embodied(bom),
+        "powerMax": power_max,
+        "powerMin": power_min,
+        "power": power,
+        "performance": aggregate_performance(bom, counts, workload_mix),
+    }
+    if country is not None:
+        GCI = (GRID_INTENSITY.get(country) or 0) / 1000
+        result["opexPerYear"] = 24 * 7 * 52 * power * GCI
+    return result
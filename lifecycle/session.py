@@ -0,0 +1,175 @@
+from .system import System
+from .compare import calculate_performance_factor, check_workload_mix, generate_systems_comparison, DEFAULT_TIME_HORIZON
+from . import constants
+from typing import Optional
+import math
+
+# Parameter -> cached components that depend on it
+DEPENDENCIES = {
+    "old_system": ("performance", "old_opex"),
+    "new_system": ("capex", "performance", "new_opex"),
+    "country": ("old_opex", "new_opex"),
+    "old_util": ("old_opex",),
+    "new_util": ("new_opex",),
+    "scaling": ("performance", "new_opex"),
+    "time_horizon": (),
+}
+
+# Additional dependencies under SCALING_UTILIZATION, where the new system
+# runs at min(100, old_util * performance factor) like the frontend sliders
+UTILIZATION_SCALING_DEPENDENCIES = {
+    "old_system": ("new_opex",),
+    "old_util": ("new_opex",),
+}
+
+# Scalings that read the performance factor
+PERFORMANCE_SCALINGS = (constants.SCALING_EMISSIONS, constants.SCALING_UTILIZATION)
+
+
+def calculate_breakeven(old_slope: float, new_slope: float, capex: float) -> Optional[float]:
+    """
+    Time step at which the new system (capex + new_slope * t) falls below the
+    old system (old_slope * t), or None if it never does.
+    """
+    if old_slope <= new_slope:
+        return None
+    return capex / (old_slope - new_slope)
+
+
+class WhatIfSession:
+    """
+    Stateful what-if comparison of an old and a new System.
+
+    Holds the current parameters and the components derived from them (new
+    system CAPEX, OPEX per time step of both systems, performance factor).
+    update() recomputes only the components that depend on the changed
+    parameters and returns the summary values that changed, e.g.
+
+        session = WhatIfSession(old_system, new_system, "Germany")
+        session.update(new_util=80)
+        # {'newSlope': ..., 'breakeven': ..., ...}
+
+    Since all OPEX curves are linear, the summary (slopes, breakeven and the
+    values at the time horizon) is computed in closed form. comparison()
+    materializes the full generate_systems_comparison result on demand.
+
+    With SCALING_UTILIZATION, new_util is ignored and the new system runs at
+    min(100, old_util * performance factor). The performance factor is only
+    computed for scalings that use it (None otherwise).
+    """
+
+    def __init__(
+        self,
+        old_system: System,
+        new_system: System,
+        country: str,
+        old_util: float = constants.UTILIZATION_DEFAULT,
+        new_util: float = constants.UTILIZATION_DEFAULT,
+        scaling: int = constants.SCALING_NONE,
+        time_horizon: int = DEFAULT_TIME_HORIZON,
+    ):
+        self.old_system = old_system
+        self.new_system = new_system
+        self.country = country
+        self.old_util = old_util
+        self.new_util = new_util
+        self.scaling = scaling
+        self.time_horizon = time_horizon
+
+        self._components = {}
+        self._recompute(("capex", "performance", "old_opex", "new_opex"))
+        self.summary = self._summarize()
+
+    def update(self, **changes) -> dict:
+        """
+        Change one or more parameters (old_system, new_system, country,
+        old_util, new_util, scaling, time_horizon).
+
+        Returns:
+            dict: Summary entries whose value changed
+        """
+        unknown = [name for name in changes if name not in DEPENDENCIES]
+        if unknown:
+            raise ValueError(f"Unknown parameter(s): {', '.join(unknown)}")
+
+        changed = []
+        for name, value in changes.items():
+            if getattr(self, name) is value or getattr(self, name) == value:
+                continue
+            setattr(self, name, value)
+            changed.append(name)
+
+        # Dependencies of the (possibly new) scaling
+        stale = set()
+        for name in changed:
+            stale.update(DEPENDENCIES[name])
+            if self.scaling == constants.SCALING_UTILIZATION:
+                stale.update(UTILIZATION_SCALING_DEPENDENCIES.get(name, ()))
+
+        self._recompute(stale)
+        previous, self.summary = self.summary, self._summarize()
+        return {key: value for key, value in self.summary.items() if previous.get(key) != value}
+
+    def comparison(self) -> dict:
+        """Full comparison for the current parameters."""
+        return generate_systems_comparison(
+            self.old_system,
+            self.new_system,
+            self.time_horizon,
+            self.country,
+            self.old_util,
+            self.effective_new_util,
+            self.scaling,
+        )
+
+    @property
+    def effective_new_util(self) -> float:
+        """Utilization of the new system, scaled from old_util under SCALING_UTILIZATION."""
+        if self.scaling == constants.SCALING_UTILIZATION:
+            return min(100, max(0, self.old_util * self._components["performance"]))
+        return self.new_util
+
+    def _recompute(self, components):
+        c = self._components
+        if "capex" in components:
+            c["capex"] = self.new_system.calculate_capex_emissions()["TOTAL"]
+        if "performance" in components:
+            check_workload_mix(self.old_system, self.new_system)
+            c["performance"] = (
+                calculate_performance_factor(self.old_system, self.new_system)
+                if self.scaling in PERFORMANCE_SCALINGS else None
+            )
+        if "old_opex" in components:
+            c["old_opex"] = self.old_system.calculate_opex_emissions(self.old_util, self.country)
+        if "new_opex" in components:
+            c["new_opex"] = self.new_system.calculate_opex_emissions(self.effective_new_util, self.country)
+
+    def _summarize(self) -> dict:
+        c = self._components
+        capex = c["capex"]
+        new_slope = c["new_opex"]["opexPerYear"]
+        old_slope = c["old_opex"]["opexPerYear"]
+        if self.scaling == constants.SCALING_EMISSIONS:
+            old_slope = old_slope / c["performance"]
+
+        # Values at the last time step, as in generate_systems_comparison
+        t = self.time_horizon - 1
+        new_total = capex + new_slope * t
+        old_total = old_slope * t
+
+        # *AtHorizon: the last entry of the per-step lists of comparison()
+        return {
+            "capex": capex,
+            "performanceFactor": c["performance"],
+            "newUtilization": self.effective_new_util,
+            "oldSlope": old_slope,
+            "newSlope": new_slope,
+            "breakeven": calculate_breakeven(old_slope, new_slope, capex),
+            "newSystemOpexAtHorizon": new_total,
+            "oldSystemOpexAtHorizon": old_total,
+            "absSavingsAtHorizon": new_total - old_total,
+            "relativeSavingsAtHorizon": 1 - (old_total / new_total),
+            "ratioAtHorizon": new_total / old_total if old_total else math.inf,
+            "oldPowerConsumption": c["old_opex"]["TOTAL"],
+            "newPowerConsumption": c["new_opex"]["TOTAL"],
+        }
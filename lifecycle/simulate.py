@@ -0,0 +1,283 @@
+from .system import System
+from .grid_intensities import GRID_INTENSITY
+from abc import ABC, abstractmethod
+from collections import deque
+from itertools import accumulate
+from typing import Iterable, Tuple, Optional, Sequence, Mapping
+import heapq
+
+
+class FleetGPU:
+    """A single GPU of a simulated fleet, located in a region (GRID_INTENSITY country)."""
+
+    def __init__(self, system: System, region: str, speed: Optional[float] = None, name: str = ""):
+        """
+        :param system: System providing the power model
+        :param region: country key of GRID_INTENSITY
+        :param speed: work units per hour, defaults to system.performance_indicator
+            (required for systems built from a WorkloadMix)
+        :param name: label in the results, defaults to system.name
+        """
+        if speed is None:
+            if system.workload_mix is not None:
+                raise ValueError(f"{system.name or 'System'} uses a workload mix, pass an explicit speed")
+            speed = system.performance_indicator
+        if not speed > 0:
+            raise ValueError(f"Speed must be positive, got {speed}")
+
+        self.system = system
+        self.region = region
+        self.speed = speed
+        self.name = name or system.name
+        self.busy_power = system.generate_normalized_power_usage(100)  # kW
+        self.idle_power = system.generate_normalized_power_usage(0)    # kW
+
+
+class StaticIntensity:
+    """Yearly average grid intensity (gCO2/kWh) from GRID_INTENSITY."""
+
+    time_varying = False
+
+    def at(self, region: str, time: float) -> float:
+        return GRID_INTENSITY.get(region) or 0
+
+    def mean(self, region: str) -> float:
+        return GRID_INTENSITY.get(region) or 0
+
+    def integral(self, region: str, start: float, end: float) -> float:
+        """Intensity integrated over [start, end] (gCO2/kWh * h)."""
+        return self.at(region, start) * (end - start)
+
+
+class ProfileIntensity:
+    """
+    Periodic grid intensity profile per region, e.g. 24 hourly or 8760 yearly
+    values in gCO2/kWh. Regions without a profile fall back to GRID_INTENSITY.
+    """
+
+    time_varying = True
+
+    def __init__(self, profiles: Mapping[str, Sequence[float]], step: float = 1.0):
+        """
+        :param profiles: region -> intensity per step
+        :param step: length of one profile step in hours
+        """
+        self.profiles = {region: list(values) for region, values in profiles.items()}
+        self.step = step
+        self._means = {region: sum(values) / len(values) for region, values in self.profiles.items()}
+        # Prefix sums, so integrals over any interval take O(1)
+        self._cumulative = {region: [0.0] + list(accumulate(values)) for region, values in self.profiles.items()}
+
+    def at(self, region: str, time: float) -> float:
+        profile = self.profiles.get(region)
+        if profile is None:
+            return GRID_INTENSITY.get(region) or 0
+        return profile[int(time / self.step) % len(profile)]
+
+    def mean(self, region: str) -> float:
+        if region in self._means:
+            return self._means[region]
+        return GRID_INTENSITY.get(region) or 0
+
+    def integral(self, region: str, start: float, end: float) -> float:
+        """Intensity integrated over [start, end] (gCO2/kWh * h)."""
+        if region not in self.profiles:
+            return (GRID_INTENSITY.get(region) or 0) * (end - start)
+        return self._integral_from_zero(region, end) - self._integral_from_zero(region, start)
+
+    def _integral_from_zero(self, region: str, time: float) -> float:
+        profile = self.profiles[region]
+        cumulative = self._cumulative[region]
+        periods, position = divmod(time / self.step, len(profile))
+        index = min(int(position), len(profile) - 1)
+        steps = periods * cumulative[-1] + cumulative[index] + (position - index) * profile[index]
+        return steps * self.step
+
+
+class Pool:
+    """Idle GPUs with identical system, region and speed."""
+
+    def __init__(self, index: int, gpu: FleetGPU):
+        self.index = index
+        self.system = gpu.system
+        self.region = gpu.region
+        self.speed = gpu.speed
+        self.busy_power = gpu.busy_power
+        self.idle_power = gpu.idle_power
+        self.idle = []
+
+
+class PlacementPolicy(ABC):
+    """
+    Chooses the pool for an arriving job among pools with an idle GPU: the
+    pool with the lowest score wins. Policies with time_varying = False are
+    scored once at the start of the simulation.
+    """
+
+    time_varying = False
+
+    @abstractmethod
+    def score(self, pool: Pool, time: float) -> float:
+        ...
+
+
+class FirstAvailable(PlacementPolicy):
+    """Fleet order."""
+
+    def score(self, pool, time):
+        return pool.index
+
+
+class FastestFirst(PlacementPolicy):
+    """Highest speed first."""
+
+    def score(self, pool, time):
+        return -pool.speed
+
+
+class LowestCarbon(PlacementPolicy):
+    """
+    Lowest marginal emissions per unit of work at the current grid intensity.
+    Idle power is drawn either way, so only the power above idle counts.
+    simulate() accounts emissions with the same intensity by default.
+    """
+
+    def __init__(self, intensity=None):
+        self.intensity = intensity or StaticIntensity()
+        self.time_varying = self.intensity.time_varying
+
+    def score(self, pool, time):
+        return self.intensity.at(pool.region, time) * (pool.busy_power - pool.idle_power) / pool.speed
+
+
+def simulate(
+    fleet: Sequence[FleetGPU],
+    jobs: Iterable[Tuple[float, float]],
+    policy: Optional[PlacementPolicy] = None,
+    intensity=None,
+    horizon: Optional[float] = None,
+):
+    """
+    Replay a job trace on a fleet with a discrete-event simulation.
+
+    Jobs arrive in trace order and are placed on an idle GPU chosen by the
+    policy; if no GPU is idle they wait in a FIFO queue and start on the next
+    GPU that finishes. A job of `work` units runs for work / speed hours.
+
+    Emissions are the idle power drawn over the whole horizon plus the extra
+    power of each job over the hours it runs, both integrated over the grid
+    intensity of the region.
+
+    Args:
+        fleet: GPUs of the fleet (ValueError if empty)
+        jobs: (arrival time in hours, work) pairs, sorted by arrival time (ValueError otherwise)
+        policy: PlacementPolicy, defaults to FirstAvailable
+        intensity: StaticIntensity or ProfileIntensity, defaults to the policy's
+            intensity if it has one (ValueError if both are given and differ),
+            else StaticIntensity
+        horizon: simulated hours, defaults to the completion of the last job
+
+    Returns:
+        dict: Per-GPU realized utilization (%), energy (kWh) and emissions (kg CO2), plus fleet totals
+    """
+    if not fleet:
+        raise ValueError("Fleet must contain at least one GPU")
+
+    policy = policy or FirstAvailable()
+    policy_intensity = getattr(policy, "intensity", None)
+    if intensity is not None and policy_intensity is not None and intensity is not policy_intensity:
+        raise ValueError("Policy and simulation use different intensities; pass the policy's intensity or none")
+    intensity = intensity or policy_intensity or StaticIntensity()
+
+    # ---- Group GPUs into pools ----
+    pools = {}
+    gpu_pool = []
+    for i, gpu in enumerate(fleet):
+        key = (id(gpu.system), gpu.region, gpu.speed)
+        if key not in pools:
+            pools[key] = Pool(len(pools), gpu)
+        pool = pools[key]
+        pool.idle.append(i)
+        gpu_pool.append(pool)
+    pools = list(pools.values())
+    ranked = sorted(pools, key=lambda p: policy.score(p, 0))
+
+    busy_time = [0.0] * len(fleet)
+    busy_emissions = [0.0] * len(fleet)  # g CO2 above idle
+    job_count = [0] * len(fleet)
+    idle_count = len(fleet)
+
+    completions = []  # heap of (finish time, gpu index)
+    queue = deque()   # waiting (arrival, work)
+    total_wait = 0.0
+    jobs_done = 0
+    now = 0.0
+
+    def start(i, time, work):
+        gpu = fleet[i]
+        duration = work / gpu.speed
+        busy_time[i] += duration
+        busy_emissions[i] += (gpu.busy_power - gpu.idle_power) * intensity.integral(gpu.region, time, time + duration)
+        job_count[i] += 1
+        heapq.heappush(completions, (time + duration, i))
+
+    def complete_until(time):
+        nonlocal idle_count, total_wait, now
+        while completions and completions[0][0] <= time:
+            now, i = heapq.heappop(completions)
+            if queue:
+                arrival, work = queue.popleft()
+                total_wait += now - arrival
+                start(i, now, work)
+            else:
+                gpu_pool[i].idle.append(i)
+                idle_count += 1
+
+    last_arrival = float("-inf")
+    for arrival, work in jobs:
+        if arrival < last_arrival:
+            raise ValueError(f"Job arrivals must be sorted, got {arrival} after {last_arrival}")
+        last_arrival = arrival
+
+        complete_until(arrival)
+        now = arrival
+        jobs_done += 1
+
+        if idle_count == 0:
+            queue.append((arrival, work))
+            continue
+
+        if policy.time_varying:
+            pool = min((p for p in pools if p.idle), key=lambda p: policy.score(p, now))
+        else:
+            pool = next(p for p in ranked if p.idle)
+        idle_count -= 1
+        start(pool.idle.pop(), now, work)
+
+    complete_until(float("inf"))
+    horizon = max(horizon or 0, now)
+
+    # ---- Results ----
+    gpus = []
+    for i, gpu in enumerate(fleet):
+        idle_energy = gpu.idle_power * horizon
+        extra_energy = (gpu.busy_power - gpu.idle_power) * busy_time[i]
+        emissions = gpu.idle_power * intensity.integral(gpu.region, 0, horizon) + busy_emissions[i]
+        gpus.append({
+            "name": gpu.name,
+            "region": gpu.region,
+            "jobs": job_count[i],
+            "busyHours": busy_time[i],
+            "utilization": 100 * busy_time[i] / horizon if horizon else 0,
+            "energy": idle_energy + extra_energy,  # kWh
+            "emissions": emissions / 1000,         # kg CO2
+        })
+
+    return {
+        "gpus": gpus,
+        "horizon": horizon,
+        "jobs": jobs_done,
+        "meanWait": total_wait / jobs_done if jobs_done else 0,
+        "energy": sum(g["energy"] for g in gpus),
+        "emissions": sum(g["emissions"] for g in gpus),
+    }
@@ -0,0 +1,263 @@
+from .compare import build_system, generate_systems_comparison, DEFAULT_TIME_HORIZON
+from .workload import WorkloadMix, workload_columns
+from . import constants
+from collections import defaultdict
+from itertools import product
+from typing import NamedTuple, Iterable, Optional, Tuple, Union
+import numpy as np
+
+# Columns of GPU_DATA.csv read by build_system (besides the workload columns)
+SYSTEM_COLUMNS = ("DIE_SIZE", "VRAM", "PROCESS", "TDP_MAX", "TDP_IDLE", "MEMORY_TYPE", "HBM_STACKS", "GPU", "DIE_COUNT")
+
+# Dependency kinds
+DEP_GPU = "gpu"
+DEP_COUNTRY = "country"
+DEP_EPA = "epa"
+DEP_GPA = "gpa"
+DEP_VRAM = "vram"
+
+
+class ComparisonKey(NamedTuple):
+    old_gpu: str
+    new_gpu: str
+    workload: Union[str, WorkloadMix]
+    country: str
+    old_util: float
+    new_util: float
+    scaling: int
+
+
+def _same_value(a, b) -> bool:
+    # NaN != NaN, but an unchanged missing value is not an update
+    return a == b or (a != a and b != b)
+
+
+def _as_scalar(value):
+    # Keep numbers as numpy scalars, like rows looked up by compare_gpus
+    # (division by a zero benchmark cell then gives inf instead of raising)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return np.asarray(value)[()]
+    return value
+
+
+def _catalog_rows(df) -> dict:
+    rows = (df.iloc[i] for i in range(len(df)))
+    return {row["GPU"]: {column: _as_scalar(value) for column, value in row.items()} for row in rows}
+
+
+class ComparisonStore:
+    """
+    Dependency-aware cache of generate_systems_comparison results.
+
+    Each cached comparison records the GPU columns, country and constants
+    (EPA / GPA / VRAM embodied) it read. Updates made through the store mark
+    only the dependent entries as dirty, so keeping a large grid current costs
+    time proportional to the change rather than to the grid.
+
+    The store works on its own copies of GRID_INTENSITY and the constants
+    tables (taken at construction), so updates never leak into other stores
+    or into compare_gpus.
+    """
+
+    def __init__(self, df, time_horizon: int = DEFAULT_TIME_HORIZON):
+        """
+        :param df: GPU dataset (pd.DataFrame with the GPU_DATA.csv columns)
+        :param time_horizon: number of time steps per comparison
+        """
+        self.time_horizon = time_horizon
+        self._rows = _catalog_rows(df)
+        self.tables = constants.copy_tables()
+        self._results = {}                    # key -> comparison dict
+        self._deps = {}                       # key -> set of dependencies
+        self._dependents = defaultdict(set)   # dependency -> set of keys
+        self._dirty = set()
+
+    def __len__(self):
+        return len(self._results)
+
+    def __contains__(self, key):
+        return key in self._results
+
+    @property
+    def dirty(self) -> int:
+        """Number of entries waiting to be recomputed."""
+        return len(self._dirty)
+
+    # ---- Lookup ----
+
+    def get(self, old_gpu: str, new_gpu: str, workload: Union[str, WorkloadMix], country: str,
+            old_util: float = 50, new_util: float = 50, scaling: int = 0):
+        """
+        Return the comparison for the given inputs, computing it if it is
+        missing or has been invalidated. Arguments mirror compare_gpus.
+        """
+        key = ComparisonKey(old_gpu, new_gpu, workload, country, old_util, new_util, scaling)
+        if key not in self._results or key in self._dirty:
+            self._compute(key)
+        return self._results[key]
+
+    def populate(self, gpus: Iterable[str], countries: Iterable[str], workloads: Iterable[Union[str, WorkloadMix]],
+                 utilizations: Iterable[Tuple] = ((50, 50),), scalings: Iterable[int] = (constants.SCALING_NONE,)) -> int:
+        """
+        Compute all ordered GPU pairs (old != new) for every country, workload,
+        (old_util, new_util) pair and scaling. Entries that are already cached
+        and clean are not recomputed.
+
+        Returns:
+            int: Number of comparisons computed
+        """
+        gpus = list(gpus)
+        pairs = [(old, new) for old in gpus for new in gpus if old != new]
+        computed = 0
+        for (old, new), country, workload, (old_util, new_util), scaling in product(
+            pairs, list(countries), list(workloads), list(utilizations), list(scalings)
+        ):
+            key = ComparisonKey(old, new, workload, country, old_util, new_util, scaling)
+            if key not in self._results or key in self._dirty:
+                self._compute(key)
+                computed += 1
+        return computed
+
+    def refresh(self) -> int:
+        """
+        Recompute every invalidated entry.
+
+        Returns:
+            int: Number of comparisons recomputed
+        """
+        dirty = list(self._dirty)
+        for key in dirty:
+            self._compute(key)
+        return len(dirty)
+
+    def items(self):
+        """Yield (ComparisonKey, comparison) for all entries, refreshing first."""
+        self.refresh()
+        return iter(self._results.items())
+
+    # ---- Updates ----
+
+    def update_gpu(self, gpu: str, **values) -> int:
+        """
+        Update columns of a single GPU row, e.g. update_gpu("H100", TDP_MAX=650).
+
+        Returns:
+            int: Number of entries invalidated
+        """
+        row = self._rows.setdefault(gpu, {"GPU": gpu})
+        deps = []
+        for column, value in values.items():
+            if column in row and _same_value(row[column], value):
+                continue
+            row[column] = _as_scalar(value)
+            deps.append((DEP_GPU, gpu, column))
+        return self._invalidate(*deps)
+
+    def update_catalog(self, df) -> int:
+        """
+        Replace the GPU dataset, invalidating only entries that read a changed
+        cell. Entries of GPUs removed from the dataset are dropped.
+
+        Returns:
+            int: Number of entries invalidated or dropped
+        """
+        rows = _catalog_rows(df)
+        affected = 0
+        for gpu in list(self._rows):
+            if gpu not in rows:
+                affected += self._drop_gpu(gpu)
+        for gpu, row in rows.items():
+            affected += self.update_gpu(gpu, **row)
+        return affected
+
+    def update_grid_intensity(self, country: str, value: Optional[float]) -> int:
+        """
+        Set the store's grid intensity of a country (gCO2/kWh) and invalidate dependent entries.
+
+        Returns:
+            int: Number of entries invalidated
+        """
+        grid_intensity = self.tables["grid_intensity"]
+        if country in grid_intensity and _same_value(grid_intensity[country], value):
+            return 0
+        grid_intensity[country] = value
+        return self._invalidate((DEP_COUNTRY, country))
+
+    def update_constants(self, energy_per_area: Optional[dict] = None, gas_per_area: Optional[dict] = None,
+                         vram_embodied: Optional[dict] = None) -> int:
+        """
+        Update the store's EPA (by process node), GPA (by process node) and
+        VRAM embodied (by memory type) tables and invalidate dependent entries.
+
+        Returns:
+            int: Number of entries invalidated
+        """
+        deps = []
+        for kind, table, changes in (
+            (DEP_EPA, self.tables["energy_per_area"], energy_per_area),
+            (DEP_GPA, self.tables["gas_per_area"], gas_per_area),
+            (DEP_VRAM, self.tables["vram_embodied"], vram_embodied),
+        ):
+            for name, value in (changes or {}).items():
+                if name in table and _same_value(table[name], value):
+                    continue
+                table[name] = value
+                deps.append((kind, name))
+        return self._invalidate(*deps)
+
+    # ---- Internals ----
+
+    def _compute(self, key: ComparisonKey):
+        old_row = self._rows[key.old_gpu]
+        new_row = self._rows[key.new_gpu]
+
+        self._results[key] = generate_systems_comparison(
+            build_system(old_row, key.workload),
+            build_system(new_row, key.workload),
+            self.time_horizon,
+            key.country,
+            key.old_util,
+            key.new_util,
+            key.scaling,
+            self.tables,
+        )
+
+        deps = {(DEP_COUNTRY, key.country)}
+        for gpu in (key.old_gpu, key.new_gpu):
+            deps.update((DEP_GPU, gpu, column) for column in SYSTEM_COLUMNS + workload_columns(key.workload))
+        # Only the new system's CAPEX enters the comparison
+        deps.add((DEP_EPA, new_row["PROCESS"]))
+        deps.add((DEP_GPA, new_row["PROCESS"]))
+        deps.add((DEP_VRAM, new_row["MEMORY_TYPE"]))
+
+        self._unlink(key)
+        self._deps[key] = deps
+        for dep in deps:
+            self._dependents[dep].add(key)
+        self._dirty.discard(key)
+
+    def _invalidate(self, *deps) -> int:
+        # Count each entry once, and only if it was clean before
+        keys = set()
+        for dep in deps:
+            keys.update(self._dependents.get(dep, ()))
+        keys -= self._dirty
+        self._dirty.update(keys)
+        return len(keys)
+
+    def _unlink(self, key: ComparisonKey):
+        for dep in self._deps.pop(key, ()):
+            dependents = self._dependents.get(dep)
+            if dependents is not None:
+                dependents.discard(key)
+                if not dependents:
+                    del self._dependents[dep]
+
+    def _drop_gpu(self, gpu: str) -> int:
+        keys = list(self._dependents.get((DEP_GPU, gpu, "GPU"), ()))
+        for key in keys:
+            self._unlink(key)
+            del self._results[key]
+            self._dirty.discard(key)
+        del self._rows[gpu]
+        return len(keys)
@@ -0,0 +1,11 @@
+import os
+
+import pandas as pd
+import pytest
+
+GPU_DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "GPU_DATA.csv")
+
+
+@pytest.fixture
+def df():
+    return pd.read_csv(GPU_DATA)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from lifecycle.export import ResultWriter, iter_numpy, read_results, to_numpy, write_results
+from lifecycle.store import ComparisonStore
+
+GPUS = ["H100", "V100", "A100(PCIE)", "A40"]
+
+
+@pytest.fixture
+def items(df):
+    store = ComparisonStore(df, time_horizon=10)
+    store.populate(GPUS, ["Germany", "France", "Ireland"], ["FP32"])
+    return list(store.items())
+
+
+@pytest.mark.parametrize("suffix", ["arrow", "parquet"])
+def test_round_trip(tmp_path, items, suffix):
+    path = str(tmp_path / f"results.{suffix}")
+    assert write_results(path, items, batch_size=5) == len(items) * 10
+
+    table = read_results(path)
+    savings = np.concatenate([np.asarray(c["absSavings"], dtype=np.float64) for _, c in items])
+    np.testing.assert_allclose(to_numpy(table, "abs_savings"), savings)
+    assert table.column("country").to_pylist()[::10] == [key.country for key, _ in items]
+
+
+def test_iter_numpy_yields_views_per_batch(tmp_path, items):
+    path = str(tmp_path / "results.arrow")
+    write_results(path, items, batch_size=5)
+    table = read_results(path)
+
+    chunks = list(iter_numpy(table, "abs_savings"))
+    assert len(chunks) == table.column("abs_savings").num_chunks > 1
+    assert all(not chunk.flags.owndata for chunk in chunks)
+    np.testing.assert_array_equal(np.concatenate(chunks), to_numpy(table, "abs_savings"))
+
+
+def test_exit_skips_flush_on_error(tmp_path, items):
+    path = str(tmp_path / "results.arrow")
+    with pytest.raises(RuntimeError):
+        with ResultWriter(path, batch_size=100) as writer:
+            writer.write_all(items[:3])
+            raise RuntimeError("sweep failed")
+    assert read_results(path).num_rows == 0
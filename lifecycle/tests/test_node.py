@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from lifecycle.compare import build_system
+from lifecycle.node import Node, gpu_components, sweep_configurations
+from lifecycle.system import System
+from lifecycle.workload import WorkloadMix
+
+NVSWITCH = {"component": "NVSwitch", "kind": "die", "area": 2.94, "process": 7, "count": 4, "power_max": 100}
+
+
+def test_single_gpu_node_matches_system(df):
+    for _, row in df.iterrows():
+        system = build_system(row, "FP32")
+        node = Node(gpu_components(system))
+        assert node.calculate_capex_emissions() == pytest.approx(system.calculate_capex_emissions())
+        assert node.generate_normalized_power_usage(50) == pytest.approx(system.generate_normalized_power_usage(50))
+
+
+def test_b200_is_costed_as_two_dies(df):
+    b200 = build_system(df[df["GPU"] == "B200"].iloc[0], "FP32")
+    assert b200.die_count == 2
+
+    die = System(8, 1, 0, b200.process_node, 1000, None, b200.memory_type, 1)
+    assert b200.calculate_capex_emissions()["GPU"] == pytest.approx(2 * die.calculate_capex_emissions()["GPU"])
+
+
+def test_only_gpu_dies_count_as_gpu(df):
+    system = build_system(df[df["GPU"] == "H100"].iloc[0], "FP32")
+    gpus = Node(gpu_components(system, 8)).calculate_capex_emissions()
+    node = Node(gpu_components(system, 8) + [NVSWITCH]).calculate_capex_emissions()
+    assert node["GPU"] == pytest.approx(gpus["GPU"])
+    assert node["TOTAL"] > gpus["TOTAL"]
+
+
+def test_sweep_with_workload_mix(df):
+    mix = WorkloadMix({"FP32": 1, "FP16": 1})
+    system = build_system(df[df["GPU"] == "H100"].iloc[0], mix)
+    bom = gpu_components(system)
+    counts = [[1, 1], [8, 8]]
+
+    with pytest.raises(ValueError, match="workload_mix"):
+        sweep_configurations(bom, counts)
+
+    performance = sweep_configurations(bom, counts, workload_mix=mix)["performance"]
+    np.testing.assert_allclose(performance["FP32"], [system.performance_indicator["FP32"] * n for n in (1, 8)])
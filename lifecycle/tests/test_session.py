@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from lifecycle import constants
+from lifecycle.compare import build_system
+from lifecycle.session import WhatIfSession
+
+SCALINGS = (constants.SCALING_NONE, constants.SCALING_UTILIZATION, constants.SCALING_EMISSIONS)
+
+
+@pytest.fixture
+def systems(df):
+    rows = {row["GPU"]: row for _, row in df.iterrows()}
+    return {gpu: build_system(rows[gpu], "FP32") for gpu in ("V100", "A100(PCIE)", "H100")}
+
+
+def fresh(session):
+    return WhatIfSession(
+        session.old_system, session.new_system, session.country, session.old_util, session.new_util,
+        session.scaling, session.time_horizon,
+    ).summary
+
+
+def assert_matches_comparison(session):
+    comparison = session.comparison()
+    for name in ("newSystemOpex", "oldSystemOpex", "absSavings", "relativeSavings", "ratio"):
+        assert session.summary[f"{name}AtHorizon"] == pytest.approx(comparison[name][-1])
+
+
+@pytest.mark.parametrize("scaling", SCALINGS)
+def test_updates_match_fresh_session(systems, scaling):
+    session = WhatIfSession(systems["V100"], systems["H100"], "Germany", scaling=scaling, time_horizon=50)
+    for changes in (
+        {"old_util": 30},
+        {"new_util": 90},
+        {"old_system": systems["A100(PCIE)"]},
+        {"country": "France", "old_util": 70},
+        {"new_system": systems["V100"], "old_system": systems["H100"]},
+        {"time_horizon": 10},
+    ):
+        session.update(**changes)
+        assert session.summary == fresh(session)
+        assert_matches_comparison(session)
+
+
+def test_utilization_scaling_follows_old_util(systems):
+    session = WhatIfSession(systems["V100"], systems["H100"], "Germany", old_util=50,
+                            scaling=constants.SCALING_UTILIZATION)
+    factor = systems["V100"].performance_indicator / systems["H100"].performance_indicator
+    assert session.summary["newUtilization"] == pytest.approx(50 * factor)
+
+    changed = session.update(old_util=80)
+    assert changed["newUtilization"] == pytest.approx(80 * factor)
+    assert "newSlope" in changed and "breakeven" in changed
+
+    # Reversed pair: the scaled utilization is clamped to 100
+    session.update(old_system=systems["H100"], new_system=systems["V100"])
+    assert session.summary["newUtilization"] == 100
+
+
+def test_switching_scaling(systems):
+    session = WhatIfSession(systems["V100"], systems["H100"], "Germany", new_util=90)
+    assert session.summary["performanceFactor"] is None
+    for scaling in SCALINGS[1:] + SCALINGS[:1]:
+        session.update(scaling=scaling)
+        assert session.summary == fresh(session)
+
+
+def test_rejects_unknown_parameter_before_changing_anything(systems):
+    session = WhatIfSession(systems["V100"], systems["H100"], "Germany")
+    with pytest.raises(ValueError, match="lifetime"):
+        session.update(old_util=10, lifetime=3)
+    assert session.old_util == constants.UTILIZATION_DEFAULT
+    assert np.isfinite(session.summary["capex"])
@@ -0,0 +1,76 @@
+import pytest
+
+from lifecycle.compare import build_system
+from lifecycle.grid_intensities import GRID_INTENSITY
+from lifecycle.simulate import FastestFirst, FleetGPU, LowestCarbon, ProfileIntensity, simulate
+from lifecycle.workload import WorkloadMix
+
+
+@pytest.fixture
+def h100(df):
+    return build_system(df[df["GPU"] == "H100"].iloc[0], "FP32")
+
+
+@pytest.fixture
+def v100(df):
+    return build_system(df[df["GPU"] == "V100"].iloc[0], "FP32")
+
+
+def test_queueing_wait_and_utilization(h100):
+    gpu = FleetGPU(h100, "Germany", speed=1)
+    result = simulate([gpu], [(0, 2), (1, 1)], horizon=6)
+
+    assert result["jobs"] == 2
+    assert result["meanWait"] == pytest.approx(0.5)  # second job waits from 1 to 2
+    assert result["horizon"] == 6
+    assert result["gpus"][0]["busyHours"] == pytest.approx(3)
+    assert result["gpus"][0]["utilization"] == pytest.approx(50)
+
+    expected = (gpu.idle_power * 6 + (gpu.busy_power - gpu.idle_power) * 3) * GRID_INTENSITY["Germany"] / 1000
+    assert result["emissions"] == pytest.approx(expected)
+
+
+def test_job_is_charged_over_the_hours_it_runs(h100):
+    gpu = FleetGPU(h100, "Germany", speed=1)
+    profile = ProfileIntensity({"Germany": [0] + [1000] * 23})
+    result = simulate([gpu], [(0, 10)], intensity=profile)
+
+    # 1 hour at 0 g/kWh, 9 hours at 1000 g/kWh, at full power
+    assert result["emissions"] == pytest.approx(gpu.busy_power * 9)
+
+
+def test_profile_integral_wraps_around():
+    profile = ProfileIntensity({"Germany": [100, 300]}, step=0.5)
+    assert profile.integral("Germany", 0.25, 2.25) == pytest.approx(400)
+    assert profile.integral("Germany", 0, 1) == pytest.approx(200)
+    assert profile.integral("France", 0, 2) == pytest.approx(2 * GRID_INTENSITY["France"])
+
+
+def test_defaults_to_the_policy_intensity(h100):
+    zero = ProfileIntensity({"Germany": [0]})
+    fleet = [FleetGPU(h100, "Germany", speed=1)]
+    assert simulate(fleet, [(0, 3)], policy=LowestCarbon(zero))["emissions"] == 0
+
+    with pytest.raises(ValueError):
+        simulate(fleet, [(0, 3)], policy=LowestCarbon(zero), intensity=ProfileIntensity({"Germany": [1]}))
+
+
+def test_lowest_carbon_places_on_cleaner_region(h100):
+    fleet = [FleetGPU(h100, "Poland", speed=1), FleetGPU(h100, "France", speed=1)]
+    result = simulate(fleet, [(0, 1)], policy=LowestCarbon())
+    assert [gpu["jobs"] for gpu in result["gpus"]] == [0, 1]
+
+
+def test_fastest_first(h100, v100):
+    fleet = [FleetGPU(v100, "Germany"), FleetGPU(h100, "Germany")]
+    result = simulate(fleet, [(0, 1)], policy=FastestFirst())
+    assert [gpu["jobs"] for gpu in result["gpus"]] == [0, 1]
+
+
+def test_rejects_invalid_input(df, h100):
+    with pytest.raises(ValueError):
+        simulate([], [(0, 1)])
+    with pytest.raises(ValueError):
+        simulate([FleetGPU(h100, "Germany")], [(1, 1), (0, 1)])
+    with pytest.raises(ValueError):
+        FleetGPU(build_system(df[df["GPU"] == "H100"].iloc[0], WorkloadMix({"FP32": 1})), "Germany")
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from lifecycle import constants
+from lifecycle.compare import build_system, generate_systems_comparison
+from lifecycle.store import ComparisonStore
+
+GPUS = ["H100", "V100", "A100(PCIE)", "A40"]
+COUNTRIES = ["Germany", "France"]
+WORKLOAD = "FP32"
+
+
+def assert_same_comparison(a, b):
+    assert a.keys() == b.keys()
+    for key in a:
+        if isinstance(a[key], dict):
+            assert_same_comparison(a[key], b[key])
+        else:
+            np.testing.assert_allclose(np.asarray(a[key], dtype=float), np.asarray(b[key], dtype=float))
+
+
+def fresh_comparisons(df, tables, store):
+    rows = {row["GPU"]: row for _, row in df.iterrows()}
+    for key, result in store.items():
+        expected = generate_systems_comparison(
+            build_system(rows[key.old_gpu], key.workload),
+            build_system(rows[key.new_gpu], key.workload),
+            store.time_horizon, key.country, key.old_util, key.new_util, key.scaling, tables,
+        )
+        yield result, expected
+
+
+@pytest.fixture
+def store(df):
+    store = ComparisonStore(df, time_horizon=20)
+    store.populate(GPUS, COUNTRIES, [WORKLOAD])
+    return store
+
+
+def test_populate_skips_clean_entries(store):
+    assert len(store) == 12 * 2
+    assert store.populate(GPUS, COUNTRIES, [WORKLOAD]) == 0
+
+
+def test_refresh_matches_fresh_comparisons_after_updates(df, store):
+    store.update_gpu("H100", TDP_MAX=650)
+    store.update_grid_intensity("Germany", 100)
+    store.update_constants(energy_per_area={7: 3.0}, vram_embodied={"HBM2": 1.0})
+    assert store.refresh() > 0
+
+    df.loc[df["GPU"] == "H100", "TDP_MAX"] = 650
+    tables = constants.copy_tables()
+    tables["grid_intensity"]["Germany"] = 100
+    tables["energy_per_area"][7] = 3.0
+    tables["vram_embodied"]["HBM2"] = 1.0
+
+    for result, expected in fresh_comparisons(df, tables, store):
+        assert_same_comparison(result, expected)
+
+
+def test_updates_do_not_touch_module_tables(store):
+    before = constants.copy_tables()
+    store.update_grid_intensity("Germany", 1)
+    store.update_constants(gas_per_area={4: 99.0})
+    assert constants.copy_tables() == before
+
+
+def test_update_counts_each_entry_once(store):
+    # H100 appears in 6 of the 12 pairs, in both countries
+    assert store.update_gpu("H100", TDP_MAX=650, TDP_IDLE=60) == 12
+    assert store.dirty == 12
+
+    # Half of the Germany entries are already dirty
+    assert store.update_grid_intensity("Germany", 100) == 6
+    assert store.dirty == 18
+
+    assert store.update_gpu("H100", TDP_MAX=650) == 0
+    assert store.update_grid_intensity("Germany", 100) == 0
+
+
+def test_update_catalog_drops_removed_gpu(df, store):
+    assert store.update_catalog(df[df["GPU"] != "A40"]) == 6 * 2
+    assert len(store) == 6 * 2
+    assert all("A40" not in (key.old_gpu, key.new_gpu) for key, _ in store.items())
+    assert store.dirty == 0
+
+
+def test_update_catalog_invalidates_changed_cells_only(df, store):
+    df.loc[df["GPU"] == "V100", "FP32"] = 20.0
+    df.loc[df["GPU"] == "GH200", "TDP_MAX"] = 1000  # not in the grid
+    assert store.update_catalog(df) == 12
+    assert store.dirty == 12
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from lifecycle import constants
+from lifecycle.compare import build_system, compare_gpus, generate_mix_breakevens, generate_systems_comparison
+from lifecycle.workload import GEOMETRIC, WorkloadMix, mix_weights, performance_factors
+
+MIX = WorkloadMix({"FP32": 1, "BENCH_MULT_FP32_TFLOPS": 1})
+
+
+def test_single_column_mix_matches_column(df):
+    for scaling in (constants.SCALING_NONE, constants.SCALING_EMISSIONS):
+        plain = compare_gpus(df, "V100", "H100", "FP32", "Germany", scaling=scaling)
+        mixed = compare_gpus(df, "V100", "H100", WorkloadMix({"FP32": 1}), "Germany", scaling=scaling)
+        np.testing.assert_allclose(mixed["oldSystemOpex"], plain["oldSystemOpex"])
+
+
+def test_vectorized_factors_match_mix(df):
+    old = build_system(df[df["GPU"] == "V100"].iloc[0], MIX)
+    new = build_system(df[df["GPU"] == "H100"].iloc[0], MIX)
+    columns = list(MIX.columns)
+    weights = mix_weights([MIX.weights], columns)
+    for mean in (MIX.mean, GEOMETRIC):
+        factor = WorkloadMix(MIX.weights, mean).performance_factor(old.performance_indicator, new.performance_indicator)
+        values = [[indicator[c] for c in columns] for indicator in (old.performance_indicator, new.performance_indicator)]
+        np.testing.assert_allclose(performance_factors(*values, weights, mean), [factor])
+
+
+def test_mix_weights_rejects_mix_without_weight():
+    with pytest.raises(ValueError):
+        mix_weights([{"FP32": 1}, {"FP16": 1}], ["FP32"])
+    with pytest.raises(ValueError):
+        mix_weights([{"FP32": -1, "FP16": 2}], ["FP32", "FP16"])
+
+
+def test_zero_cell_only_matters_when_scaling(df):
+    # P100 has no BENCH_MULT_FP32_TFLOPS result
+    compare_gpus(df, "P100", "H100", MIX, "Germany", scaling=constants.SCALING_NONE)
+    with pytest.raises(ValueError, match="BENCH_MULT_FP32_TFLOPS"):
+        compare_gpus(df, "P100", "H100", MIX, "Germany", scaling=constants.SCALING_EMISSIONS)
+
+    old = build_system(df[df["GPU"] == "P100"].iloc[0], MIX)
+    new = build_system(df[df["GPU"] == "H100"].iloc[0], MIX)
+    weights = mix_weights([{"FP32": 1}, {"FP32": 1, "BENCH_MULT_FP32_TFLOPS": 1}], list(MIX.columns))
+    breakevens = generate_mix_breakevens(old, new, "Germany", 50, 50, constants.SCALING_NONE, weights, list(MIX.columns))
+    assert breakevens[0] == breakevens[1]
+
+
+def test_rejects_mix_on_one_system(df):
+    old = build_system(df[df["GPU"] == "V100"].iloc[0], "FP32")
+    new = build_system(df[df["GPU"] == "H100"].iloc[0], MIX)
+    with pytest.raises(ValueError, match="same workload mix"):
+        generate_systems_comparison(old, new, 10, "Germany", 50, 50, constants.SCALING_NONE)
@@ -0,0 +1,122 @@
+from typing import Mapping, Sequence
+import math
+import numpy as np
+
+HARMONIC = "harmonic"
+GEOMETRIC = "geometric"
+
+
+class WorkloadMix:
+    """
+    Weighted mix of benchmark columns (e.g. MMULT_16, SORTING, TPCXAI) used as
+    performance indicator. The performance factor old/new is computed per
+    component and combined by a weighted harmonic or geometric mean.
+    """
+
+    def __init__(self, weights: Mapping[str, float], mean: str = HARMONIC):
+        """
+        :param weights: benchmark column -> weight (normalized to sum to 1)
+        :param mean: HARMONIC or GEOMETRIC
+        """
+        if mean not in (HARMONIC, GEOMETRIC):
+            raise ValueError(f"Unknown mean: {mean}")
+        total = sum(weights.values())
+        if not weights or total <= 0 or any(w < 0 for w in weights.values()):
+            raise ValueError("Weights must be non-negative and sum to a positive value")
+
+        self.weights = {column: w / total for column, w in weights.items() if w > 0}
+        self.mean = mean
+
+    @property
+    def columns(self) -> tuple:
+        return tuple(self.weights)
+
+    def performance_indicator(self, row) -> dict:
+        """Per-component performance values of a GPU_DATA.csv row."""
+        return {column: row[column] for column in self.columns}
+
+    def performance_factor(self, old_indicator: Mapping[str, float], new_indicator: Mapping[str, float]) -> float:
+        """
+        Combine the per-component factors old / new into one factor.
+        Raises ValueError if a component is missing, zero or negative.
+        """
+        for indicator, label in ((old_indicator, "old"), (new_indicator, "new")):
+            _check_components([indicator.get(c) for c in self.columns], self.columns, label)
+
+        if self.mean == HARMONIC:
+            return 1 / sum(w * new_indicator[c] / old_indicator[c] for c, w in self.weights.items())
+        return math.exp(sum(w * math.log(old_indicator[c] / new_indicator[c]) for c, w in self.weights.items()))
+
+    def _key(self):
+        return (self.mean, tuple(sorted(self.weights.items())))
+
+    def __eq__(self, other):
+        return isinstance(other, WorkloadMix) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __str__(self):
+        return f"{self.mean}(" + ",".join(f"{c}:{w:g}" for c, w in self.weights.items()) + ")"
+
+    __repr__ = __str__
+
+
+def _check_components(values, columns, label):
+    for column, value in zip(columns, values):
+        if value is None or not value > 0:  # also catches NaN
+            raise ValueError(f"Workload mix needs a positive {label} system value for {column}, got {value}")
+
+
+def workload_columns(workload) -> tuple:
+    """Benchmark columns read for a workload (column name or WorkloadMix)."""
+    return workload.columns if isinstance(workload, WorkloadMix) else (workload,)
+
+
+def mix_weights(mixes: Sequence[Mapping[str, float]], columns: Sequence[str]) -> np.ndarray:
+    """
+    Stack candidate mixes into a normalized weight matrix.
+
+    Args:
+        mixes: benchmark column -> weight, one mapping per candidate mix
+        columns: column order of the matrix
+
+    Returns:
+        np.ndarray: Weights of shape (len(mixes), len(columns)), rows sum to 1
+
+    Raises ValueError for a mix with negative weights or no weight on columns.
+    """
+    weights = np.array([[mix.get(c, 0.0) for c in columns] for mix in mixes], dtype=np.float64)
+    totals = weights.sum(axis=1, keepdims=True)
+    invalid = np.flatnonzero(~(totals[:, 0] > 0) | (weights < 0).any(axis=1))
+    if invalid.size:
+        raise ValueError(f"Weights of mix {invalid[0]} must be non-negative and sum to a positive value over {list(columns)}")
+    return weights / totals
+
+
+def performance_factors(old_values, new_values, weights, mean: str = HARMONIC) -> np.ndarray:
+    """
+    Evaluate many mixes at once.
+
+    Args:
+        old_values: per-component performance of the old system(s), shape (..., k)
+        new_values: per-component performance of the new system(s), shape (..., k)
+        weights: normalized weight matrix of shape (m, k), see mix_weights
+        mean: HARMONIC or GEOMETRIC
+
+    Returns:
+        np.ndarray: Performance factors old / new of shape (..., m)
+    """
+    old_values = np.asarray(old_values, dtype=np.float64)
+    new_values = np.asarray(new_values, dtype=np.float64)
+    for values, label in ((old_values, "old"), (new_values, "new")):
+        if not np.all(values > 0):
+            raise ValueError(f"Workload mix needs positive {label} system values, got {values}")
+
+    ratios = old_values / new_values
+    weights = np.asarray(weights, dtype=np.float64)
+    if mean == HARMONIC:
+        return 1 / ((1 / ratios) @ weights.T)
+    if mean == GEOMETRIC:
+        return np.exp(np.log(ratios) @ weights.T)
+    raise ValueError(f"Unknown mean: {mean}")